@@ -22,13 +22,21 @@ except ImportError:
     # For direct execution
     from tools.artifact_tools import save_research_artifact, load_research_artifacts, get_artifact_summary
 
+try:
+    from .tools.consensus_tools import get_consensus_snapshot
+except ImportError:
+    # For direct execution
+    from tools.consensus_tools import get_consensus_snapshot
+
 # Import callbacks
 try:
     from .callbacks import (
         before_agent_callback,
         after_agent_callback,
         before_model_callback,
-        after_model_callback
+        after_model_callback,
+        before_tool_callback,
+        after_tool_callback
     )
 except ImportError:
     # For direct execution
@@ -36,7 +44,9 @@ except ImportError:
         before_agent_callback,
         after_agent_callback,
         before_model_callback,
-        after_model_callback
+        after_model_callback,
+        before_tool_callback,
+        after_tool_callback
     )
 
 load_dotenv()
@@ -52,12 +62,15 @@ root_agent = Agent(
         save_research_artifact,
         load_research_artifacts,
         get_artifact_summary,
+        get_consensus_snapshot,
         search_agent_tool
     ],
     before_agent_callback=before_agent_callback,
     after_agent_callback=after_agent_callback,
     before_model_callback=before_model_callback,
     after_model_callback=after_model_callback,
+    before_tool_callback=before_tool_callback,
+    after_tool_callback=after_tool_callback,
     instruction="""
     
 You are the Top 10 Agent orchestrator. You help users find the ACTUAL best 5 products/services by analyzing real top 10 lists from credible sources.
@@ -75,21 +88,25 @@ You are the Top 10 Agent orchestrator. You help users find the ACTUAL best 5 pro
 - Use get_artifact_summary to see what research data is available
 - If you have recent results, you can build on them
 
-### Step 3: Delegate Search for Top 10 Lists
-Tell the search_agent_tool to find top 10 lists for the category. Be specific:
+### Step 3: Search One Query at a Time
+Call search_agent_tool with ONE query per call, starting with the most promising:
 - "Search for top 10 lists for [category]"
-- "Focus on recent reviews from credible sources"
-- "Find actual comparison articles and buying guides"
+- "Search for best [category] reviews from testing sites"
+- "Search for [category] buying guides"
+
+Each search result already includes the running consensus across all searches so far:
+- 'top_5': the current top 5 products with their scores and sources
+- 'stable': whether to stop searching, with 'stable_reason' explaining why
+- 'searches_remaining': searches left in this session's budget
 
-The search tool will:
-- Look for curated "top 10" lists from review sites
-- Identify which products appear across multiple lists
-- Note the credibility and methodology of sources
+If 'stable' is true, STOP searching and move on to analysis.
+Otherwise run the next query, until stable or no searches remain.
 
 ### Step 4: Deep Analysis with Analyzer
-Once you receive the search results:
-- Delegate to analyzer_agent subagent for deep analysis of the lists
-- The analyzer will identify consensus picks across multiple sources
+Once searching stops:
+- Use get_consensus_snapshot to get the accumulated products and their list appearances
+- Delegate to analyzer_agent subagent with the search results and the consensus snapshot
+- The analyzer will confirm consensus picks across multiple sources
 - It will evaluate source credibility (Tier 1/2/3)
 - It will extract product details, strengths, weaknesses
 - Save the analysis as an artifact using save_research_artifact (type: 'analysis')
@@ -139,7 +156,7 @@ Consider:
 2. **Transparency**: Always say which lists recommended each product
 3. **No fictional products**: Only recommend products that actually appeared in the lists
 4. **Source quality matters**: A recommendation from Wirecutter > random blog
-5. **Track search limits**: Maximum 5 searches per session (tracked in state)
+5. **Track search limits**: Maximum 5 searches per session (tracked in state; extra searches are skipped)
 6. **Use Artifacts**: Save all research data for reuse and transparency
 7. **Delegate Analysis**: Use analyzer_agent for deep list analysis
 
@@ -2,16 +2,35 @@
 Simple callback functions for state management in the Top 10 Agent system
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models.llm_request import LlmRequest
 from google.adk.models.llm_response import LlmResponse
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.tool_context import ToolContext
 from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
 from google.adk.sessions.in_memory_session_service import InMemorySessionService
 from google.genai import types
 from datetime import datetime
 import uuid
 
+try:
+    from .tools.consensus_tools import (
+        parse_structured_sources,
+        record_search,
+        searches_remaining
+    )
+except ImportError:
+    # For direct execution
+    from tools.consensus_tools import (
+        parse_structured_sources,
+        record_search,
+        searches_remaining
+    )
+
+# Name of the AgentTool wrapping the search agent
+SEARCH_TOOL_NAME = "search_specialist"
+
 # Create memory and session services
 memory_service = InMemoryMemoryService()
 session_service = InMemorySessionService()
@@ -32,17 +51,64 @@ async def before_agent_callback(
     # Update last activity
     callback_context.state['last_activity'] = datetime.now().isoformat()
     
-    # Simple search limit check
-    if callback_context.state.get('searches_count', 0) >= 5:
-        return types.ModelContent(
-            parts=[types.Part(
-                text="Search limit reached (5 searches per session). Please start a new session."
-            )]
-        )
-    
     return None
 
 
+async def before_tool_callback(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext
+) -> Optional[Dict[str, Any]]:
+    """
+    Skip searches once the session's search budget is used up.
+    """
+    if tool.name != SEARCH_TOOL_NAME or searches_remaining(tool_context.state) > 0:
+        return None
+
+    return {
+        'result': "Search skipped: the search limit for this session is used up. "
+                  "Continue with the results gathered so far.",
+        'searches_remaining': 0,
+        'stable': True,
+        'stable_reason': 'budget_exhausted'
+    }
+
+
+async def after_tool_callback(
+    tool: BaseTool,
+    args: Dict[str, Any],
+    tool_context: ToolContext,
+    tool_response: Any
+) -> Optional[Dict[str, Any]]:
+    """
+    Fold each completed search into the running consensus.
+
+    Returns the search result with the consensus attached, so the
+    orchestrator sees 'stable' and 'top_5' without another model call.
+    """
+    if tool.name != SEARCH_TOOL_NAME:
+        return None
+
+    # before_tool_callback skipped this search; its response passes through here unchanged
+    if searches_remaining(tool_context.state) == 0:
+        return None
+
+    # AgentTool returns plain text, which ADK later wraps as {'result': ...}
+    if isinstance(tool_response, dict):
+        text = tool_response.get('result', '')
+    else:
+        text = tool_response
+    category, sources = parse_structured_sources(text)
+    summary = record_search(
+        tool_context.state,
+        query=str(args.get('request', '')),
+        sources=sources,
+        category=category
+    )
+
+    return {'result': text, **summary}
+
+
 async def after_agent_callback(callback_context: CallbackContext):
     """
     Simple update of last activity time.
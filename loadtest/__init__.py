@@ -0,0 +1,23 @@
+"""
+Load-testing harness for concurrent Top 10 Agent sessions
+Run with: python -m loadtest --help (from this directory)
+"""
+
+from .harness import (
+    run_load_test,
+    save_baseline,
+    load_baseline,
+    compare_reports
+)
+from .stubs import SessionProfile, StubLlm, parse_latency, session_profile
+
+__all__ = [
+    'run_load_test',
+    'save_baseline',
+    'load_baseline',
+    'compare_reports',
+    'SessionProfile',
+    'StubLlm',
+    'parse_latency',
+    'session_profile'
+]
@@ -0,0 +1,88 @@
+"""
+Command-line entry point for the load-test harness
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from .harness import (
+    DEFAULT_REGRESSION_THRESHOLD,
+    compare_reports,
+    format_comparison,
+    format_report,
+    load_baseline,
+    run_load_test,
+    save_baseline
+)
+
+
+def _percent(value: str) -> float:
+    """Parse '10%' or '10' as 0.10."""
+    try:
+        percent = float(value.strip().rstrip('%'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid percentage: '{value}'")
+    if percent < 0:
+        raise argparse.ArgumentTypeError("percentage must not be negative")
+    return percent / 100
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m loadtest",
+        description="Run concurrent simulated sessions against root_agent with stubbed Gemini and google_search."
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="sessions in flight at once (default: 10)")
+    parser.add_argument("-n", "--sessions", type=int, default=None, help="total sessions to run (default: concurrency)")
+    parser.add_argument("--model-latency", default="lognormal:-1.0,0.5",
+                        help="model call latency: const:S, uniform:LOW,HIGH, normal:MEAN,SD, lognormal:MU,SIGMA or exp:MEAN")
+    parser.add_argument("--search-latency", default="uniform:0.3,1.2", help="extra google_search latency, same format")
+    parser.add_argument("--max-searches", type=int, default=5, help="searches per session before analysis (default: 5)")
+    parser.add_argument("--seed", type=int, default=None, help="random seed for latencies and stub content")
+    parser.add_argument("--warmup", type=int, default=1, help="unmeasured warm-up sessions run first (default: 1)")
+    parser.add_argument("--artifacts-dir", default=None, help="working directory for artifact files")
+    parser.add_argument("--verbose", action="store_true", help="show the agent's stdout while running")
+    parser.add_argument("--save", metavar="NAME", help="save the report as loadtest/baselines/NAME.json")
+    parser.add_argument("--compare", metavar="BASELINE", help="compare against a baseline name or JSON path")
+    parser.add_argument("--threshold", type=_percent, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help="relative change flagged as a regression in --compare (default: 10%%)")
+    parser.add_argument("--json", action="store_true", help="print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1 or (args.sessions is not None and args.sessions < 1):
+        parser.error("--concurrency and --sessions must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+
+    try:
+        report = asyncio.run(run_load_test(
+            concurrency=args.concurrency,
+            sessions=args.sessions,
+            model_latency=args.model_latency,
+            search_latency=args.search_latency,
+            max_searches=args.max_searches,
+            seed=args.seed,
+            warmup=args.warmup,
+            artifacts_dir=args.artifacts_dir,
+            quiet=not args.verbose
+        ))
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+    if args.compare:
+        print()
+        print(format_comparison(compare_reports(load_baseline(args.compare), report, args.threshold)))
+
+    if args.save:
+        path = save_baseline(report, args.save)
+        print(f"\nBaseline saved to {path}")
+
+    return 1 if report['results']['sessions_failed'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
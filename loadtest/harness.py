@@ -0,0 +1,429 @@
+"""
+Load-test harness for concurrent Top 10 Agent sessions
+Drives root_agent through the same ADK Runner that adk web uses, with the
+module-level session/memory services, real tools and callbacks, and
+stubbed models, and records throughput, latency, loop lag and memory
+"""
+
+from typing import Any, Dict, List, Optional
+from google.adk.artifacts.in_memory_artifact_service import InMemoryArtifactService
+from google.adk.runners import Runner
+from google.genai import types
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from pathlib import Path
+import asyncio
+import importlib
+import json
+import math
+import os
+import platform
+import random
+import resource
+import sys
+import time
+import uuid
+
+from .stubs import (
+    CATEGORIES,
+    STUB_MODEL_NAME,
+    SessionProfile,
+    StubLlm,
+    parse_latency,
+    session_profile
+)
+
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent
+BASELINES_DIR = Path(__file__).resolve().parent / "baselines"
+APP_NAME = PACKAGE_DIR.name
+
+LOOP_LAG_INTERVAL = 0.01
+
+# Relative change a metric may move in the bad direction before it's flagged
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+# Metrics compared against a baseline, with whether higher is better and the
+# smallest absolute change worth flagging (guards near-zero baselines from noise)
+COMPARED_METRICS = [
+    ('throughput_sessions_per_s', True, 0.01),
+    ('latency_s.p50', False, 0.005),
+    ('latency_s.p95', False, 0.005),
+    ('latency_s.p99', False, 0.005),
+    ('loop_lag_ms.p99', False, 1.0),
+    ('loop_lag_ms.max', False, 1.0),
+    ('memory_mb.growth', False, 1.0)
+]
+
+
+def _import_app():
+    """
+    Import the agent package the way adk web does.
+
+    Returns:
+        The agent package's agent, agents and callbacks modules
+    """
+    if str(PACKAGE_DIR.parent) not in sys.path:
+        sys.path.insert(0, str(PACKAGE_DIR.parent))
+    agent_module = importlib.import_module(f"{APP_NAME}.agent")
+    agents_module = importlib.import_module(f"{APP_NAME}.agents")
+    callbacks_module = importlib.import_module(f"{APP_NAME}.callbacks")
+    return agent_module, agents_module, callbacks_module
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MB, falling back to the peak."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _percentiles(values: List[float], scale: float = 1.0) -> Dict[str, float]:
+    """Nearest-rank p50/p95/p99 plus mean and max."""
+    if not values:
+        return {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'mean': 0.0, 'max': 0.0}
+    ordered = sorted(values)
+
+    def rank(p: float) -> float:
+        index = max(0, min(len(ordered) - 1, math.ceil(p / 100 * len(ordered)) - 1))
+        return round(ordered[index] * scale, 3)
+
+    return {
+        'p50': rank(50),
+        'p95': rank(95),
+        'p99': rank(99),
+        'mean': round(sum(ordered) / len(ordered) * scale, 3),
+        'max': round(ordered[-1] * scale, 3)
+    }
+
+
+async def _monitor(samples: Dict[str, List[float]], stop: asyncio.Event):
+    """Sample event-loop lag and RSS until stopped."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        start = loop.time()
+        await asyncio.sleep(LOOP_LAG_INTERVAL)
+        samples['lag'].append(max(0.0, loop.time() - start - LOOP_LAG_INTERVAL))
+        samples['rss'].append(_rss_mb())
+
+
+async def _run_session(
+    runner: Runner,
+    session_service: Any,
+    index: Any,
+    profile: SessionProfile
+) -> Dict[str, Any]:
+    """Create one simulated user session and run a single query to completion."""
+    user_id = f"load_user_{index}"
+    session_id = uuid.uuid4().hex
+    category = profile.rng.choice(CATEGORIES)
+    message = types.Content(role='user', parts=[types.Part(text=f"What are the best {category}?")])
+
+    start = time.perf_counter()
+    events = 0
+    try:
+        with session_profile(profile):
+            await session_service.create_session(app_name=APP_NAME, user_id=user_id, session_id=session_id)
+            async for _ in runner.run_async(user_id=user_id, session_id=session_id, new_message=message):
+                events += 1
+        error = None
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        'latency': time.perf_counter() - start,
+        'events': events,
+        'error': error
+    }
+
+
+@contextmanager
+def _stubbed_app(max_searches: int, workdir: Path, quiet: bool):
+    """
+    Swap stub models into the agents and run inside the artifacts workdir.
+
+    The agents' original models, the working directory and stdout are all
+    restored on exit.
+
+    Yields:
+        The agent package's agent, agents and callbacks modules
+    """
+    agent_module, agents_module, callbacks_module = _import_app()
+    roles = [
+        (agent_module.root_agent, 'orchestrator'),
+        (agents_module.search_agent, 'search'),
+        (agents_module.analyzer_agent, 'analyzer')
+    ]
+    original_models = [(agent, agent.model) for agent, _ in roles]
+    original_cwd = os.getcwd()
+
+    # save_research_artifact writes relative to the working directory
+    workdir.mkdir(parents=True, exist_ok=True)
+    # Discard rather than buffer the callbacks' prints so they don't skew memory
+    sink = open(os.devnull, 'w') if quiet else sys.stdout
+    try:
+        for agent, role in roles:
+            agent.model = StubLlm(model=STUB_MODEL_NAME, role=role, max_searches=max_searches)
+        os.chdir(workdir)
+        with redirect_stdout(sink):
+            yield agent_module, agents_module, callbacks_module
+    finally:
+        os.chdir(original_cwd)
+        for agent, model in original_models:
+            agent.model = model
+        if quiet:
+            sink.close()
+
+
+async def run_load_test(
+    concurrency: int = 10,
+    sessions: Optional[int] = None,
+    model_latency: str = "lognormal:-1.0,0.5",
+    search_latency: str = "uniform:0.3,1.2",
+    max_searches: int = 5,
+    seed: Optional[int] = None,
+    warmup: int = 1,
+    artifacts_dir: Optional[str] = None,
+    quiet: bool = True
+) -> Dict[str, Any]:
+    """
+    Run concurrent simulated sessions against root_agent with stubbed models.
+
+    Warm-up sessions run first, unmeasured, so one-time import and
+    first-call costs don't land in the loop-lag and memory figures. Every
+    session gets its own random source derived from the seed and its
+    index, so a seeded run replays the same workload regardless of
+    scheduling. The agents' models and the working directory are restored
+    afterwards.
+
+    Args:
+        concurrency: Sessions in flight at once
+        sessions: Total sessions to run (optional, defaults to concurrency)
+        model_latency: Latency distribution spec for every model call
+        search_latency: Extra latency spec for each google_search stand-in
+        max_searches: Searches the stub orchestrator makes before analysis
+        seed: Random seed for latencies and stub content (optional)
+        warmup: Unmeasured sessions to run, one at a time, beforehand
+        artifacts_dir: Working directory for artifact files (optional,
+            defaults to a fresh directory under loadtest/runs)
+        quiet: Swallow the agent's stdout while the sessions run
+
+    Returns:
+        Report with the config, environment and measured results
+    """
+    sessions = sessions or concurrency
+    # Fail on a bad spec before touching the agents
+    parse_latency(model_latency)
+    parse_latency(search_latency)
+    config = {
+        'concurrency': concurrency,
+        'sessions': sessions,
+        'model_latency': model_latency,
+        'search_latency': search_latency,
+        'max_searches': max_searches,
+        'seed': seed,
+        'warmup': warmup
+    }
+
+    def profile(index: Any) -> SessionProfile:
+        rng = random.Random(f"{seed}:{index}") if seed is not None else random.Random()
+        return SessionProfile(rng, model_latency, search_latency)
+
+    workdir = Path(artifacts_dir) if artifacts_dir else (
+        Path(__file__).resolve().parent / "runs" / datetime.now().strftime("%Y%m%d_%H%M%S")
+    )
+
+    with _stubbed_app(max_searches, workdir, quiet) as (agent_module, _, callbacks_module):
+        session_service = callbacks_module.session_service
+        runner = Runner(
+            app_name=APP_NAME,
+            agent=agent_module.root_agent,
+            session_service=session_service,
+            memory_service=callbacks_module.memory_service,
+            artifact_service=InMemoryArtifactService()
+        )
+
+        for i in range(warmup):
+            await _run_session(runner, session_service, f"warmup_{i}", profile(f"warmup_{i}"))
+
+        samples = {'lag': [], 'rss': []}
+        stop = asyncio.Event()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(index: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await _run_session(runner, session_service, index, profile(index))
+
+        rss_start = _rss_mb()
+        monitor = asyncio.create_task(_monitor(samples, stop))
+        start = time.perf_counter()
+        try:
+            outcomes = await asyncio.gather(*(bounded(i) for i in range(sessions)))
+        finally:
+            duration = time.perf_counter() - start
+            stop.set()
+            await monitor
+        rss_end = _rss_mb()
+
+    completed = [o for o in outcomes if not o['error']]
+    errors = [o['error'] for o in outcomes if o['error']]
+
+    results = {
+        'sessions_completed': len(completed),
+        'sessions_failed': len(errors),
+        'errors': sorted(set(errors))[:10],
+        'duration_s': round(duration, 3),
+        'throughput_sessions_per_s': round(len(completed) / duration, 3) if duration else 0.0,
+        'events_per_session': round(sum(o['events'] for o in completed) / len(completed), 2) if completed else 0.0,
+        'latency_s': _percentiles([o['latency'] for o in completed]),
+        'loop_lag_ms': _percentiles(samples['lag'], scale=1000),
+        'memory_mb': {
+            'start': round(rss_start, 2),
+            'end': round(rss_end, 2),
+            'peak': round(max(samples['rss'] + [rss_start, rss_end]), 2),
+            'growth': round(rss_end - rss_start, 2)
+        }
+    }
+
+    return {
+        'timestamp': datetime.now().isoformat(),
+        'config': config,
+        'environment': _environment(),
+        'results': results
+    }
+
+
+def _environment() -> Dict[str, Any]:
+    """Interpreter and library versions, so baselines stay comparable."""
+    try:
+        from google.adk import __version__ as adk_version
+    except ImportError:
+        adk_version = 'unknown'
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'adk': adk_version
+    }
+
+
+def save_baseline(report: Dict[str, Any], name: str) -> Path:
+    """
+    Save a report as a named baseline.
+
+    Args:
+        report: Report returned by run_load_test
+        name: Baseline name, stored as loadtest/baselines/<name>.json
+
+    Returns:
+        Path of the saved baseline
+    """
+    BASELINES_DIR.mkdir(parents=True, exist_ok=True)
+    path = BASELINES_DIR / f"{name}.json"
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_baseline(name_or_path: str) -> Dict[str, Any]:
+    """
+    Load a baseline by name or file path.
+
+    Args:
+        name_or_path: Baseline name under loadtest/baselines or a JSON path
+
+    Returns:
+        The saved report
+    """
+    path = Path(name_or_path)
+    if not path.exists():
+        path = BASELINES_DIR / f"{name_or_path}.json"
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _metric(results: Dict[str, Any], dotted: str) -> Optional[float]:
+    """Look up a dotted metric path such as 'latency_s.p95'."""
+    value: Any = results
+    for key in dotted.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """
+    Compare a report's key metrics against a baseline.
+
+    Args:
+        baseline: Earlier report
+        current: New report
+        threshold: Relative change (0.10 = 10%) a metric may move in the
+            bad direction before it counts as a regression. Changes below
+            the metric's absolute floor in COMPARED_METRICS are never
+            flagged, which also covers a zero baseline
+
+    Returns:
+        One row per metric with both values, percent change and whether
+        the change is a regression
+    """
+    rows = []
+    for metric, higher_is_better, floor in COMPARED_METRICS:
+        before = _metric(baseline.get('results', {}), metric)
+        after = _metric(current.get('results', {}), metric)
+        if before is None or after is None:
+            continue
+        change = (after - before) / abs(before) if before else None
+        worse = after < before if higher_is_better else after > before
+        worse = worse and abs(after - before) > floor
+        if change is not None:
+            worse = worse and abs(change) > threshold
+        rows.append({
+            'metric': metric,
+            'baseline': before,
+            'current': after,
+            'change_pct': round(change * 100, 1) if change is not None else None,
+            'regression': worse
+        })
+    return rows
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable summary of a report."""
+    config = report['config']
+    results = report['results']
+    latency = results['latency_s']
+    lag = results['loop_lag_ms']
+    memory = results['memory_mb']
+
+    lines = [
+        f"Sessions: {results['sessions_completed']} completed, {results['sessions_failed']} failed "
+        f"({config['concurrency']} concurrent)",
+        f"Duration: {results['duration_s']}s",
+        f"Throughput: {results['throughput_sessions_per_s']} sessions/s",
+        f"Latency (s): p50 {latency['p50']}  p95 {latency['p95']}  p99 {latency['p99']}  max {latency['max']}",
+        f"Event-loop lag (ms): p50 {lag['p50']}  p95 {lag['p95']}  p99 {lag['p99']}  max {lag['max']}",
+        f"Memory (MB): start {memory['start']}  end {memory['end']}  peak {memory['peak']}  growth {memory['growth']}"
+    ]
+    for error in results['errors']:
+        lines.append(f"Error: {error}")
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Human-readable baseline comparison table."""
+    lines = [f"{'Metric':<28}{'Baseline':>12}{'Current':>12}{'Change':>10}"]
+    for row in rows:
+        change = f"{row['change_pct']:+.1f}%" if row['change_pct'] is not None else "n/a"
+        flag = "  !" if row['regression'] else ""
+        lines.append(f"{row['metric']:<28}{row['baseline']:>12}{row['current']:>12}{change:>10}{flag}")
+    return "\n".join(lines)
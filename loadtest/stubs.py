@@ -0,0 +1,235 @@
+"""
+Local stand-ins for Gemini and google_search used by the load-test harness
+Each agent gets a scripted StubLlm that sleeps for a sampled latency and
+then answers the way the real model would drive the Top 10 workflow.
+Randomness comes from the calling session's SessionProfile, so a session's
+workload doesn't depend on how concurrent sessions are scheduled
+"""
+
+from typing import Any, AsyncGenerator, Callable, List, Optional
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+from contextlib import contextmanager
+from contextvars import ContextVar
+import asyncio
+import json
+import random
+
+
+# Model name the stubs report so google_search accepts the search agent
+STUB_MODEL_NAME = "gemini-2.0-flash-exp"
+
+LATENCY_KINDS = ('const', 'uniform', 'normal', 'lognormal', 'exp')
+
+CATEGORIES = [
+    "wireless headphones",
+    "budget laptops",
+    "coffee makers",
+    "hiking backpacks",
+    "robot vacuums",
+    "mechanical keyboards"
+]
+
+SOURCES = [
+    ("Wirecutter", 1),
+    ("Consumer Reports", 1),
+    ("RTings", 1),
+    ("CNET", 2),
+    ("TechRadar", 2),
+    ("PCMag", 2),
+    ("Tom's Guide", 2),
+    ("Reddit roundup", 3),
+    ("Affiliate blog", 3)
+]
+
+PRODUCTS_PER_CATEGORY = 12
+PRODUCTS_PER_LIST = 10
+
+_current_profile: ContextVar[Optional["SessionProfile"]] = ContextVar(
+    "loadtest_session_profile", default=None
+)
+
+
+def parse_latency(spec: str, rng: Optional[random.Random] = None) -> Callable[[], float]:
+    """
+    Build a latency sampler from a distribution spec.
+
+    Args:
+        spec: 'const:S', 'uniform:LOW,HIGH', 'normal:MEAN,STDDEV',
+            'lognormal:MU,SIGMA' or 'exp:MEAN', all in seconds
+        rng: Random source (optional, defaults to a fresh unseeded one)
+
+    Returns:
+        Zero-argument callable returning a non-negative delay in seconds
+    """
+    rng = rng or random.Random()
+    kind, _, raw_params = spec.partition(':')
+    kind = kind.strip().lower()
+    try:
+        params = [float(p) for p in raw_params.split(',') if p.strip()]
+    except ValueError:
+        raise ValueError(f"Invalid latency parameters in '{spec}'")
+
+    expected = {'const': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2, 'exp': 1}
+    if kind not in expected:
+        raise ValueError(f"Unknown latency distribution '{kind}', expected one of {', '.join(LATENCY_KINDS)}")
+    if len(params) != expected[kind]:
+        raise ValueError(f"Latency distribution '{kind}' takes {expected[kind]} parameter(s), got '{spec}'")
+
+    if kind == 'const':
+        sample = lambda: params[0]
+    elif kind == 'uniform':
+        sample = lambda: rng.uniform(params[0], params[1])
+    elif kind == 'normal':
+        sample = lambda: rng.gauss(params[0], params[1])
+    elif kind == 'lognormal':
+        sample = lambda: rng.lognormvariate(params[0], params[1])
+    else:
+        sample = lambda: rng.expovariate(1.0 / params[0]) if params[0] > 0 else 0.0
+
+    return lambda: max(0.0, sample())
+
+
+class SessionProfile:
+    """
+    Random source and latency samplers for one simulated session.
+
+    Args:
+        rng: The session's own random source
+        model_latency: Latency distribution spec for every model call
+        search_latency: Extra latency spec for each google_search stand-in
+    """
+
+    def __init__(self, rng: random.Random, model_latency: str, search_latency: str):
+        self.rng = rng
+        self.model_latency = parse_latency(model_latency, rng)
+        self.search_latency = parse_latency(search_latency, rng)
+
+
+@contextmanager
+def session_profile(profile: SessionProfile):
+    """Make the stubs draw from this profile within the current task."""
+    token = _current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+def _text(llm_request: LlmRequest) -> str:
+    """Concatenated text of the user turns in a request."""
+    chunks = []
+    for content in llm_request.contents or []:
+        if content.role != 'user':
+            continue
+        for part in content.parts or []:
+            if part.text:
+                chunks.append(part.text)
+    return "\n".join(chunks)
+
+
+def _function_responses(llm_request: LlmRequest) -> List[types.FunctionResponse]:
+    """Function responses already in the request, oldest first."""
+    responses = []
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            if part.function_response:
+                responses.append(part.function_response)
+    return responses
+
+
+def _category(text: str) -> str:
+    """Category named in a simulated user message."""
+    for category in CATEGORIES:
+        if category in text.lower():
+            return category
+    return CATEGORIES[0]
+
+
+class StubLlm(BaseLlm):
+    """
+    Scripted model that replays the Top 10 workflow for one agent role.
+
+    Roles are 'orchestrator', 'search' and 'analyzer'. The search role also
+    stands in for google_search by adding search latency to every reply.
+    Latency and content come from the active session_profile(); outside
+    one, replies are immediate and unseeded.
+    """
+
+    role: str
+    max_searches: int = 5
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        profile = _current_profile.get()
+        if profile:
+            delay = profile.model_latency()
+            if self.role == 'search':
+                delay += profile.search_latency()
+            await asyncio.sleep(delay)
+        rng = profile.rng if profile else random.Random()
+
+        if self.role == 'orchestrator':
+            part = self._orchestrator_step(llm_request)
+        elif self.role == 'search':
+            part = types.Part(text=self._search_reply(_text(llm_request), rng))
+        else:
+            part = types.Part(text="**Consensus Top Products**: stub analysis complete.")
+
+        yield LlmResponse(content=types.Content(role='model', parts=[part]))
+
+    def _orchestrator_step(self, llm_request: LlmRequest) -> types.Part:
+        """Next tool call for the orchestrator, based on the responses so far."""
+        category = _category(_text(llm_request))
+        responses = _function_responses(llm_request)
+        names = [r.name for r in responses]
+        searches = [r for r in responses if r.name == 'search_specialist']
+
+        if 'load_research_artifacts' not in names:
+            return self._call('load_research_artifacts', category=category)
+
+        # The root after_tool_callback attaches the running consensus to each search
+        stable = bool(searches and (searches[-1].response or {}).get('stable'))
+        if not stable and len(searches) < self.max_searches:
+            return self._call('search_specialist', request=f"top 10 {category} #{len(searches) + 1}")
+
+        if 'save_research_artifact' not in names:
+            return self._call(
+                'save_research_artifact',
+                category=category,
+                artifact_type='analysis',
+                data={'searches': len(searches), 'stable': stable}
+            )
+
+        return self._call('transfer_to_agent', agent_name='list_analyzer')
+
+    def _search_reply(self, request: str, rng: random.Random) -> str:
+        """Search agent reply with a Structured Sources block."""
+        category = _category(request)
+        # Lower-numbered products are favoured so lists broadly agree
+        pool = [f"{category.title()} Model {i + 1}" for i in range(PRODUCTS_PER_CATEGORY)]
+        weights = [PRODUCTS_PER_CATEGORY - i for i in range(PRODUCTS_PER_CATEGORY)]
+
+        sources = []
+        for name, tier in rng.sample(SOURCES, rng.randint(2, 4)):
+            ranked = []
+            while len(ranked) < PRODUCTS_PER_LIST:
+                pick = rng.choices(pool, weights=weights)[0]
+                if pick not in ranked:
+                    ranked.append(pick)
+            sources.append({'source': name, 'tier': tier, 'url': None, 'products': ranked})
+        block = {'category': category, 'sources': sources}
+
+        return (
+            f"**Search Query**: {request}\n"
+            f"**Results Found**: {len(sources)}\n\n"
+            "**Structured Sources**:\n"
+            f"```json\n{json.dumps(block, indent=2)}\n```"
+        )
+
+    @staticmethod
+    def _call(name: str, **args: Any) -> types.Part:
+        return types.Part(function_call=types.FunctionCall(name=name, args=args))
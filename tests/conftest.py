@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Make the agent's top-level modules (tools, agents, callbacks) importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
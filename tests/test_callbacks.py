@@ -0,0 +1,59 @@
+"""
+Tests for the search budget and consensus tool callbacks
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from callbacks import SEARCH_TOOL_NAME, after_tool_callback, before_tool_callback
+from tools.consensus_tools import MAX_SEARCHES_PER_SESSION
+
+
+REPLY = """**Search Query**: best headphones
+```json
+{"category": "headphones", "sources": [
+  {"source": "A", "tier": 1, "products": ["M1", "M2", "M3", "M4", "M5", "M6"]}
+]}
+```"""
+
+
+def _call_search(tool, tool_context, request):
+    """Run a search the way ADK chains the tool callbacks around it."""
+    args = {'request': request}
+    response = asyncio.run(before_tool_callback(tool, args, tool_context))
+    ran = response is None
+    if ran:
+        response = REPLY
+    altered = asyncio.run(after_tool_callback(tool, args, tool_context, response))
+    return ran, altered if altered is not None else response
+
+
+def test_search_callbacks_record_then_skip_over_budget():
+    tool = SimpleNamespace(name=SEARCH_TOOL_NAME)
+    tool_context = SimpleNamespace(state={})
+
+    outcomes = [_call_search(tool, tool_context, f"q{i}") for i in range(MAX_SEARCHES_PER_SESSION + 1)]
+
+    assert [ran for ran, _ in outcomes] == [True] * MAX_SEARCHES_PER_SESSION + [False]
+    recorded = outcomes[0][1]
+    assert recorded['result'] == REPLY
+    assert recorded['searches_used'] == 1
+    assert recorded['top_5'][0]['name'] == "M1"
+
+    skipped = outcomes[-1][1]
+    assert skipped['stable_reason'] == 'budget_exhausted'
+    assert tool_context.state['searches_count'] == MAX_SEARCHES_PER_SESSION
+    assert len(tool_context.state['consensus']['queries']) == MAX_SEARCHES_PER_SESSION
+
+
+def test_other_tools_pass_through():
+    tool = SimpleNamespace(name="load_research_artifacts")
+    tool_context = SimpleNamespace(state={})
+
+    assert asyncio.run(before_tool_callback(tool, {}, tool_context)) is None
+    assert asyncio.run(after_tool_callback(tool, {}, tool_context, {'result': []})) is None
+    assert 'searches_count' not in tool_context.state
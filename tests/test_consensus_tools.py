@@ -0,0 +1,148 @@
+"""
+Tests for the incremental consensus and its early-stop rules
+"""
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from tools.consensus_tools import (
+    MAX_SEARCHES_PER_SESSION,
+    TIER_WEIGHTS,
+    _is_settled,
+    _source_points,
+    parse_structured_sources,
+    record_search
+)
+
+
+def _source(name, products, tier=1):
+    return {'source': name, 'tier': tier, 'url': None, 'products': products}
+
+
+PRODUCTS = [f"Model {i}" for i in range(1, 11)]
+
+
+def test_source_points_weights_tier_and_rank():
+    assert _source_points(1, 1) == TIER_WEIGHTS[1]
+    assert _source_points(3, 1) == TIER_WEIGHTS[3]
+    assert _source_points(2, 10) == pytest.approx(TIER_WEIGHTS[2] / 10)
+    # Unknown tiers count as Tier 3, out-of-range ranks as the last rank
+    assert _source_points(None, 1) == TIER_WEIGHTS[3]
+    assert _source_points(1, 42) == _source_points(1, 10)
+
+
+def test_stable_after_unchanged_searches():
+    state = {}
+    results = [record_search(state, f"q{i}", [_source("A", PRODUCTS)], "headphones") for i in range(3)]
+
+    assert [r['stable'] for r in results] == [False, False, True]
+    assert results[-1]['stable_reason'] == 'unchanged'
+    assert results[-1]['searches_used'] == 3
+    assert [p['name'] for p in results[-1]['top_5']] == PRODUCTS[:5]
+
+
+def test_empty_searches_do_not_count_as_unchanged():
+    state = {}
+    record_search(state, "q1", [_source("A", PRODUCTS)], "headphones")
+    second = record_search(state, "q2", [], "headphones")
+    third = record_search(state, "q3", [], "headphones")
+
+    assert not second['stable']
+    assert not third['stable']
+    assert third['searches_used'] == 3
+    assert state['consensus']['contributing_searches'] == 1
+
+
+def test_malformed_sources_are_skipped():
+    state = {}
+    result = record_search(state, "q1", [
+        "Wirecutter",
+        {'source': 'No products'},
+        {'source': 'Bad products', 'products': "Model 1"},
+        _source("List tier", ["Model 1"], tier=[1]),
+        _source("String tier", ["Model 2"], tier="1"),
+    ], "headphones")
+
+    assert result['sources_recorded'] == 2
+    products = state['consensus']['products']
+    assert products['model 1']['score'] == TIER_WEIGHTS[3]
+    assert products['model 2']['score'] == TIER_WEIGHTS[1]
+
+
+def test_parse_structured_sources():
+    reply = 'Found lists\n```json\n{"category": "Headphones", "sources": [{"source": "A", "products": []}]}\n```'
+    assert parse_structured_sources(reply) == ("Headphones", [{"source": "A", "products": []}])
+    assert parse_structured_sources('```json\n[{"source": "A"}]\n```') == (None, [{"source": "A"}])
+    assert parse_structured_sources("```json\n{not json\n```") == (None, [])
+    assert parse_structured_sources("no block here") == (None, [])
+    assert parse_structured_sources(None) == (None, [])
+
+
+def test_settled_bound():
+    ranking = [{'name': f"P{i}", 'score': s, 'appearances': []} for i, s in enumerate([20, 19, 18, 17, 16, 2])]
+
+    # 5th leads 6th by 14; one search of two sources can add at most 6
+    assert _is_settled(ranking, searches_remaining=1, max_sources_per_search=2)
+    # Three such searches could add 18, so the 6th could still overtake
+    assert not _is_settled(ranking, searches_remaining=3, max_sources_per_search=2)
+    # Fewer than five products can never be settled
+    assert not _is_settled(ranking[:4], searches_remaining=0, max_sources_per_search=2)
+
+
+def test_settled_reported_once_evidence_is_in():
+    state = {}
+    top = PRODUCTS[:5]
+    # Five Tier 1 lists per search, each rotating the same five products
+    rotations = [_source(f"S{i}", top[i:] + top[:i]) for i in range(5)]
+    first = record_search(state, "q1", rotations, "headphones")
+    assert not first['stable']
+
+    state['searches_count'] = MAX_SEARCHES_PER_SESSION - 2
+    result = record_search(state, "q2", rotations, "headphones")
+
+    # Each product has 24 points; one more search could add at most 5 * 3 = 15
+    assert result['searches_remaining'] == 1
+    assert result['stable_reason'] == 'settled'
+
+
+def test_budget_exhausted_is_its_own_reason():
+    state = {'searches_count': MAX_SEARCHES_PER_SESSION - 1}
+    result = record_search(state, "q1", [_source("A", PRODUCTS)], "headphones")
+
+    assert result['searches_remaining'] == 0
+    assert result['stable']
+    assert result['stable_reason'] == 'budget_exhausted'
+
+
+def test_budget_exhausted_wins_over_settled():
+    state = {}
+    results = []
+    # Every search brings a new, stronger top 5, so it never settles
+    for i in range(MAX_SEARCHES_PER_SESSION):
+        fresh = [f"Search {i} Model {j}" for j in range(5)]
+        sources = [_source(f"S{i}-{k}", fresh) for k in range(i + 1)]
+        results.append(record_search(state, f"q{i}", sources, "headphones"))
+
+    assert [r['stable'] for r in results[:-1]] == [False] * (MAX_SEARCHES_PER_SESSION - 1)
+    assert state['consensus']['contributing_searches'] == MAX_SEARCHES_PER_SESSION
+    assert results[-1]['searches_remaining'] == 0
+    assert results[-1]['stable_reason'] == 'budget_exhausted'
+
+
+def test_category_reset_ignores_case_and_whitespace():
+    state = {}
+    record_search(state, "q1", [_source("A", PRODUCTS)], "wireless headphones")
+    record_search(state, "q2", [_source("B", PRODUCTS)], "  Wireless Headphones ")
+    assert state['consensus']['contributing_searches'] == 2
+
+    # Omitting the category keeps the current consensus
+    record_search(state, "q3", [_source("C", PRODUCTS)])
+    assert state['consensus']['contributing_searches'] == 3
+
+    record_search(state, "q4", [_source("D", PRODUCTS)], "coffee makers")
+    assert state['consensus']['category'] == "coffee makers"
+    assert state['consensus']['contributing_searches'] == 1
+    assert state['consensus']['queries'] == ["q4"]
+    # The session budget keeps counting across categories
+    assert state['searches_count'] == 4
@@ -0,0 +1,92 @@
+"""
+Tests for the load-test harness's pure helpers
+"""
+
+import argparse
+import random
+
+import pytest
+
+pytest.importorskip("google.adk")
+
+from loadtest.__main__ import _percent
+from loadtest.harness import _percentiles, compare_reports
+from loadtest.stubs import parse_latency
+
+
+def _report(**results):
+    report = {'throughput_sessions_per_s': 10.0, 'latency_s': {'p95': 1.0}, 'loop_lag_ms': {'p99': 5.0}}
+    for key, value in results.items():
+        section, _, field = key.partition('__')
+        if field:
+            report[section] = dict(report.get(section, {}), **{field: value})
+        else:
+            report[section] = value
+    return {'results': report}
+
+
+def _rows(baseline, current, threshold=0.10):
+    return {row['metric']: row for row in compare_reports(baseline, current, threshold)}
+
+
+@pytest.mark.parametrize("spec", ["foo:1", "const:", "uniform:1", "normal:1,2,3", "const:x"])
+def test_parse_latency_rejects_bad_specs(spec):
+    with pytest.raises(ValueError):
+        parse_latency(spec)
+
+
+def test_parse_latency_samples_are_seeded_and_non_negative():
+    first = parse_latency("normal:0,1", random.Random(7))
+    second = parse_latency("normal:0,1", random.Random(7))
+    samples = [first() for _ in range(50)]
+
+    assert samples == [second() for _ in range(50)]
+    assert min(samples) == 0.0
+    assert parse_latency("const:0.25")() == 0.25
+
+
+def test_percentiles_use_nearest_rank():
+    result = _percentiles(list(range(1, 11)))
+    assert result == {'p50': 5, 'p95': 10, 'p99': 10, 'mean': 5.5, 'max': 10}
+
+    assert _percentiles(list(range(1, 101)))['p95'] == 95
+    assert _percentiles([0.002], scale=1000)['p99'] == 2.0
+    assert _percentiles([])['p50'] == 0.0
+
+
+def test_compare_flags_only_changes_past_threshold_in_bad_direction():
+    baseline = _report()
+
+    small = _rows(baseline, _report(latency_s__p95=1.05, throughput_sessions_per_s=9.5))
+    assert not small['latency_s.p95']['regression']
+    assert not small['throughput_sessions_per_s']['regression']
+
+    worse = _rows(baseline, _report(latency_s__p95=1.5, throughput_sessions_per_s=8.0))
+    assert worse['latency_s.p95']['regression']
+    assert worse['latency_s.p95']['change_pct'] == 50.0
+    assert worse['throughput_sessions_per_s']['regression']
+
+    better = _rows(baseline, _report(latency_s__p95=0.5, throughput_sessions_per_s=20.0))
+    assert not better['latency_s.p95']['regression']
+    assert not better['throughput_sessions_per_s']['regression']
+
+    strict = _rows(baseline, _report(latency_s__p95=1.05), threshold=0.01)
+    assert strict['latency_s.p95']['regression']
+
+
+def test_compare_zero_baseline_uses_absolute_floor():
+    baseline = _report(loop_lag_ms__p99=0.0)
+
+    noise = _rows(baseline, _report(loop_lag_ms__p99=0.1))['loop_lag_ms.p99']
+    assert noise['change_pct'] is None
+    assert not noise['regression']
+
+    assert _rows(baseline, _report(loop_lag_ms__p99=25.0))['loop_lag_ms.p99']['regression']
+
+
+def test_percent_parses_percentages():
+    assert _percent("10%") == pytest.approx(0.10)
+    assert _percent(" 2.5 ") == pytest.approx(0.025)
+    for bad in ("ten", "-5%"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _percent(bad)
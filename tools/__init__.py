@@ -7,9 +7,11 @@ from .artifact_tools import (
     load_research_artifacts,
     get_artifact_summary
 )
+from .consensus_tools import get_consensus_snapshot
 
 __all__ = [
     'save_research_artifact',
     'load_research_artifacts',
-    'get_artifact_summary'
+    'get_artifact_summary',
+    'get_consensus_snapshot'
 ]
@@ -0,0 +1,275 @@
+"""
+Incremental consensus for pipelining search results into analysis
+Each completed search's structured sources are folded into a running
+consensus by the root agent's tool callbacks, so the orchestrator can stop
+searching as soon as the top 5 is settled
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from google.adk.tools.tool_context import ToolContext
+from datetime import datetime
+import json
+import re
+
+
+MAX_SEARCHES_PER_SESSION = 5
+TOP_N = 5
+
+# Points per source by credibility tier (see analyzer_agent source tiers)
+TIER_WEIGHTS = {1: 3.0, 2: 2.0, 3: 1.0}
+MAX_LIST_RANK = 10
+
+# Consecutive contributing searches that must leave the top 5 membership unchanged
+UNCHANGED_SEARCHES_FOR_STABLE = 2
+
+
+def _normalize_category(category: Any) -> Optional[str]:
+    """Category key that ignores case and surrounding whitespace."""
+    if not isinstance(category, str) or not category.strip():
+        return None
+    return category.strip().lower()
+
+
+def _coerce_tier(tier: Any) -> Optional[int]:
+    """Tier as an int, or None when it can't be read as one."""
+    try:
+        return int(tier)
+    except (TypeError, ValueError):
+        return None
+
+
+def _source_points(tier: Optional[int], rank: Optional[int]) -> float:
+    """
+    Points a single list appearance adds to a product.
+
+    Higher-tier sources and higher list positions count for more. Unknown
+    tiers are treated as Tier 3 and unranked appearances as the last rank.
+    """
+    weight = TIER_WEIGHTS.get(tier, TIER_WEIGHTS[3])
+    if not rank or rank < 1 or rank > MAX_LIST_RANK:
+        rank = MAX_LIST_RANK
+    return weight * (MAX_LIST_RANK + 1 - rank) / MAX_LIST_RANK
+
+
+def _max_source_points() -> float:
+    """Most points any single source can give one product."""
+    return _source_points(1, 1)
+
+
+def _ranking(products: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Products ordered by score, then appearances, then name."""
+    return sorted(
+        products.values(),
+        key=lambda p: (-p['score'], -len(p['appearances']), p['name'].lower())
+    )
+
+
+def _is_settled(
+    ranking: List[Dict[str, Any]],
+    searches_remaining: int,
+    max_sources_per_search: int
+) -> bool:
+    """
+    Check whether the remaining searches are unlikely to change the top 5.
+
+    This is a heuristic, not a hard bound: each remaining search is
+    assumed to return at most as many sources as the largest search seen
+    so far, each giving a product at most the Tier 1 / rank 1 points. If
+    the 5th product leads the 6th (or an unseen product) by more than
+    that, the top 5 membership is treated as settled. A later search that
+    returns more sources than any before it could still change it.
+    """
+    if len(ranking) < TOP_N:
+        return False
+
+    max_gain = searches_remaining * max_sources_per_search * _max_source_points()
+    fifth_score = ranking[TOP_N - 1]['score']
+    sixth_score = ranking[TOP_N]['score'] if len(ranking) > TOP_N else 0.0
+
+    return fifth_score - sixth_score > max_gain
+
+
+def searches_remaining(state: Any) -> int:
+    """Searches left in the session budget."""
+    return max(MAX_SEARCHES_PER_SESSION - state.get('searches_count', 0), 0)
+
+
+def parse_structured_sources(text: Any) -> Tuple[Optional[str], List[Any]]:
+    """
+    Pull the Structured Sources block out of a search agent reply.
+
+    Args:
+        text: The search agent's reply
+
+    Returns:
+        The category (None if not given) and the list of sources, empty
+        when the block is missing or not valid JSON
+    """
+    match = re.search(r"```json\s*(.*?)```", str(text or ''), re.DOTALL)
+    if not match:
+        return None, []
+    try:
+        block = json.loads(match.group(1))
+    except json.JSONDecodeError:
+        return None, []
+
+    if isinstance(block, list):
+        return None, block
+    if isinstance(block, dict) and isinstance(block.get('sources'), list):
+        category = block.get('category')
+        return (category if isinstance(category, str) else None), block['sources']
+    return None, []
+
+
+def record_search(
+    state: Any,
+    query: str,
+    sources: List[Any],
+    category: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Fold one completed search into state['consensus'] and count it.
+
+    The top 5 is reported as stable once there is enough evidence (at
+    least TOP_N products from more than one contributing search) and
+    either the remaining budget is unlikely to change it ('settled', see
+    _is_settled) or it survived consecutive contributing searches
+    ('unchanged'). A used-up budget always stops searching and takes
+    precedence, reported as 'budget_exhausted'.
+
+    Args:
+        state: Session state (ADK State or a plain dict)
+        query: The search request that produced these sources
+        sources: Structured sources, each a dict with 'source' (site name),
+            'tier' (1, 2 or 3), 'url' (optional) and 'products' (product
+            names in list order, best first); anything else is skipped
+        category: The product category searched (optional, keeps the
+            current consensus when omitted)
+
+    Returns:
+        Current top 5, whether it is stable and why, and searches
+        used/remaining
+    """
+    category_key = _normalize_category(category)
+    consensus = dict(state.get('consensus') or {})
+    current_key = consensus.get('category')
+    if not consensus or (category_key and current_key and current_key != category_key):
+        consensus = {
+            'category': category_key,
+            'queries': [],
+            'products': {},
+            'max_sources_per_search': 0,
+            'contributing_searches': 0,
+            'unchanged_streak': 0
+        }
+    elif category_key and not current_key:
+        consensus['category'] = category_key
+    previous_top = [p['name'].lower() for p in consensus.get('top_5', [])]
+
+    products = {key: dict(product) for key, product in consensus['products'].items()}
+    sources_used = 0
+    appearances_added = 0
+    for source in sources:
+        if not isinstance(source, dict) or not isinstance(source.get('products'), list):
+            continue
+        source_name = str(source.get('source') or 'unknown')
+        tier = _coerce_tier(source.get('tier'))
+        added = 0
+        for position, name in enumerate(source['products'], start=1):
+            if not isinstance(name, str) or not name.strip():
+                continue
+            name = name.strip()
+            product = products.setdefault(name.lower(), {'name': name, 'score': 0.0, 'appearances': []})
+            product['appearances'] = product['appearances'] + [{
+                'source': source_name,
+                'tier': tier,
+                'rank': position,
+                'url': source.get('url')
+            }]
+            product['score'] = round(product['score'] + _source_points(tier, position), 3)
+            added += 1
+        if added:
+            sources_used += 1
+            appearances_added += added
+
+    consensus['products'] = products
+    consensus['queries'] = consensus['queries'] + [query]
+    consensus['max_sources_per_search'] = max(consensus['max_sources_per_search'], sources_used)
+
+    state['searches_count'] = state.get('searches_count', 0) + 1
+    remaining = searches_remaining(state)
+
+    ranking = _ranking(products)
+    if appearances_added:
+        consensus['contributing_searches'] = consensus['contributing_searches'] + 1
+        current_top = [p['name'].lower() for p in ranking[:TOP_N]]
+        if len(current_top) == TOP_N and set(current_top) == set(previous_top):
+            consensus['unchanged_streak'] = consensus['unchanged_streak'] + 1
+        else:
+            consensus['unchanged_streak'] = 0
+
+    enough_evidence = len(products) >= TOP_N and consensus['contributing_searches'] > 1
+    # With no searches left _is_settled has nothing to bound, so check the budget first
+    if remaining == 0:
+        stable_reason = 'budget_exhausted'
+    elif enough_evidence and _is_settled(ranking, remaining, consensus['max_sources_per_search']):
+        stable_reason = 'settled'
+    elif enough_evidence and consensus['unchanged_streak'] >= UNCHANGED_SEARCHES_FOR_STABLE:
+        stable_reason = 'unchanged'
+    else:
+        stable_reason = None
+    stable = stable_reason is not None
+
+    top_products = [
+        {
+            'name': p['name'],
+            'score': p['score'],
+            'appearances': len(p['appearances']),
+            'sources': [a['source'] for a in p['appearances']]
+        }
+        for p in ranking[:TOP_N]
+    ]
+
+    consensus['stable'] = stable
+    consensus['stable_reason'] = stable_reason
+    consensus['top_5'] = top_products
+    consensus['updated'] = datetime.now().isoformat()
+    state['consensus'] = consensus
+
+    return {
+        'searches_used': state['searches_count'],
+        'searches_remaining': remaining,
+        'sources_recorded': sources_used,
+        'stable': stable,
+        'stable_reason': stable_reason,
+        'products_tracked': len(products),
+        'top_5': top_products
+    }
+
+
+async def get_consensus_snapshot(
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """
+    Get the full running consensus built from this session's searches.
+
+    Args:
+        tool_context: ADK tool context holding the session state
+
+    Returns:
+        Category, queries run, stability and every tracked product with
+        its list appearances, best first
+    """
+    state = tool_context.state if tool_context else {}
+    consensus = state.get('consensus')
+    if not consensus:
+        return {'status': 'empty', 'products': []}
+
+    return {
+        'status': 'stable' if consensus.get('stable') else 'in_progress',
+        'stable_reason': consensus.get('stable_reason'),
+        'category': consensus.get('category'),
+        'queries': consensus.get('queries', []),
+        'top_5': consensus.get('top_5', []),
+        'products': _ranking(consensus.get('products', {}))
+    }